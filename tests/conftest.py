@@ -100,12 +100,8 @@ def pipeline_config() -> PipelineConfig:
     )
 
 
-@pytest.fixture
-def project() -> Project:
-    """Create a fixture for a project representation."""
-    flexmock(Project)
-    flexmock(RuntimeEnvironment)
-
+def _get_project() -> Project:
+    """Create a project representation."""
     pipfile_path = AdviserTestCase.data_dir / "projects" / "Pipfile"
     pipfile_lock_path = AdviserTestCase.data_dir / "projects" / "Pipfile.lock"
 
@@ -116,6 +112,21 @@ def project() -> Project:
     )
 
 
+@pytest.fixture
+def project() -> Project:
+    """Create a fixture for a project representation."""
+    flexmock(Project)
+    flexmock(RuntimeEnvironment)
+
+    return _get_project()
+
+
+@pytest.fixture(scope="session")
+def project_factory() -> Callable[[], Project]:
+    """Return a project factory - handy to be used in fixtures with a broader scope."""
+    return _get_project
+
+
 @pytest.fixture
 def graph() -> GraphDatabase:
     """Create a knowledge graph connector fixture."""
@@ -19,10 +19,24 @@
 
 import sys
 import functools
+import importlib
+from types import ModuleType
 from typing import Any
+from typing import Tuple
 
 import tests.units as units
-import thoth.adviser
+
+
+_UNIT_TYPES = ("boots", "pseudonyms", "sieves", "steps", "strides", "wraps")
+
+
+@functools.lru_cache(maxsize=1)
+def _discover() -> Tuple[Tuple[str, ModuleType, ModuleType], ...]:
+    """Pair pipeline unit modules provided by the testsuite with the ones implemented in adviser."""
+    return tuple(
+        (unit_type, getattr(units, unit_type), importlib.import_module(f"thoth.adviser.{unit_type}"))
+        for unit_type in _UNIT_TYPES
+    )
 
 
 def use_test_units(func: Any) -> Any:
@@ -31,32 +45,16 @@ def use_test_units(func: Any) -> Any:
     @functools.wraps(func)
     def wrapped(*args: Any, **kwargs: Any) -> Any:
         """Substitute implemented units with the testing ones."""
-        sys.modules["thoth.adviser"].boots = units.boots
-        sys.modules["thoth.adviser.boots"] = units.boots
-        sys.modules["thoth.adviser"].pseudonyms = units.pseudonyms
-        sys.modules["thoth.adviser.pseudonyms"] = units.pseudonyms
-        sys.modules["thoth.adviser"].sieves = units.sieves
-        sys.modules["thoth.adviser.sieves"] = units.sieves
-        sys.modules["thoth.adviser"].steps = units.steps
-        sys.modules["thoth.adviser.steps"] = units.steps
-        sys.modules["thoth.adviser"].strides = units.strides
-        sys.modules["thoth.adviser.strides"] = units.strides
-        sys.modules["thoth.adviser"].wraps = units.wraps
-        sys.modules["thoth.adviser.wraps"] = units.wraps
+        adviser_module = sys.modules["thoth.adviser"]
+        discovered = _discover()
+        for unit_type, test_module, _ in discovered:
+            setattr(adviser_module, unit_type, test_module)
+            sys.modules[f"thoth.adviser.{unit_type}"] = test_module
         try:
             return func(*args, **kwargs)
         finally:
-            sys.modules["thoth.adviser"].boots = thoth.adviser.boots
-            sys.modules["thoth.adviser.boots"] = thoth.adviser.boots
-            sys.modules["thoth.adviser"].pseudonyms = thoth.adviser.pseudonyms
-            sys.modules["thoth.adviser.pseudonyms"] = thoth.adviser.pseudonyms
-            sys.modules["thoth.adviser"].sieves = thoth.adviser.sieves
-            sys.modules["thoth.adviser.sieves"] = thoth.adviser.sieves
-            sys.modules["thoth.adviser"].steps = thoth.adviser.steps
-            sys.modules["thoth.adviser.steps"] = thoth.adviser.steps
-            sys.modules["thoth.adviser"].strides = thoth.adviser.strides
-            sys.modules["thoth.adviser.strides"] = thoth.adviser.strides
-            sys.modules["thoth.adviser"].wraps = thoth.adviser.wraps
-            sys.modules["thoth.adviser.wraps"] = thoth.adviser.wraps
+            for unit_type, _, original_module in discovered:
+                setattr(adviser_module, unit_type, original_module)
+                sys.modules[f"thoth.adviser.{unit_type}"] = original_module
 
     return wrapped
@@ -17,13 +17,21 @@
 
 """Test adviser's context passed to pipeline units."""
 
+from typing import Callable
+from typing import Optional
 from typing import Tuple
+from typing import Type
+from typing import Union
 
+import attr
 import pytest
 
 from thoth.python import PackageVersion
+from thoth.python import Project
 from thoth.python import Source
+from thoth.storages import GraphDatabase
 
+from thoth.adviser.beam import Beam
 from thoth.adviser.state import State
 from thoth.adviser.context import Context
 from thoth.adviser.enums import RecommendationType
@@ -32,45 +40,73 @@ from thoth.adviser.exceptions import NotFound
 
 from .base import AdviserTestCase
 
+_LATEST = RecommendationType.LATEST
+_ALL = DecisionType.ALL
 
-@pytest.fixture
+_PYPI_SOURCE = Source("https://pypi.org/simple")
+
+
+@pytest.fixture(scope="module")
 def package_version() -> PackageVersion:  # noqa: D401
     """A fixture for a package version representative."""
     return PackageVersion(
         name="selinon",
         version="==1.0.0",
-        index=Source("https://pypi.org/simple"),
+        index=_PYPI_SOURCE,
         develop=False,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def package_tuple() -> Tuple[str, str, str]:  # noqa: D401
     """A fixture for a package tuple representative."""
     return "selinon", "1.0.0", "https://pypi.org/simple"
 
 
-class TestContext(AdviserTestCase):
-    """Test context carried within resolution."""
+@pytest.fixture(scope="module")
+def context_template(project_factory: Callable[[], Project]) -> Context:  # noqa: D401
+    """A context instantiated once per module, individual tests obtain a copy of it."""
+    return Context(
+        project=project_factory(),
+        graph=GraphDatabase(),
+        library_usage=None,
+        limit=100,
+        count=3,
+        beam=Beam(),
+        recommendation_type=_LATEST,
+    )
 
-    def test_get_package_version(self, context: Context, package_version: PackageVersion) -> None:
-        """Test getting registering and getting a package version."""
-        with pytest.raises(NotFound):
-            context.get_package_version(package_version.to_tuple())
 
-        assert context.register_package_version(package_version) is False
-        assert context.get_package_version(package_version.to_tuple()) is package_version
+@pytest.fixture
+def context(context_template: Context) -> Context:
+    """Create a clean context for each test, mutable state is not shared with the template."""
+    return attr.evolve(
+        context_template,
+        package_versions={},
+        dependencies={},
+        dependents={},
+        sources={},
+        cli_parameters={},
+        stack_info=[],
+        accepted_states=[],
+        beam=Beam(),
+    )
 
-    def test_get_package_version_graceful(self, context: Context, package_version: PackageVersion) -> None:
-        """Test getting registered package version, gracefully."""
-        assert context.get_package_version(package_version.to_tuple(), graceful=True) is None
-        with pytest.raises(NotFound):
-            context.get_package_version(package_version.to_tuple(), graceful=False)
 
-        assert context.register_package_version(package_version) is False
+class TestContext(AdviserTestCase):
+    """Test context carried within resolution."""
 
-        assert context.get_package_version(package_version.to_tuple(), graceful=True) is package_version
-        assert context.get_package_version(package_version.to_tuple(), graceful=False) is package_version
+    @pytest.mark.parametrize("graceful", [True, False])
+    def test_get_package_version(self, context: Context, package_version: PackageVersion, graceful: bool) -> None:
+        """Test getting registering and getting a package version, gracefully and non-gracefully."""
+        if graceful:
+            assert context.get_package_version(package_version.to_tuple(), graceful=True) is None
+        else:
+            with pytest.raises(NotFound):
+                context.get_package_version(package_version.to_tuple(), graceful=False)
+
+        assert context.register_package_version(package_version) is False
+        assert context.get_package_version(package_version.to_tuple(), graceful=graceful) is package_version
 
     def test_get_top_accepted_final_state(self, context: Context) -> None:
         """Test retrieval of top accepted final state."""
@@ -234,64 +270,40 @@ class TestContext(AdviserTestCase):
         assert package_tuple in context.dependents[package_tuple[0]]
         assert context.dependents[package_tuple[0]][package_tuple] == set()
 
-    def test_is_dependency_monkey(self) -> None:
-        """Test checking if the given context is an adviser context."""
-        context = Context(
-            project=None,
-            graph=None,
-            library_usage=None,
-            limit=None,
-            count=None,
-            beam=None,
-            recommendation_type=None,
-            decision_type=DecisionType.ALL,
-        )
-
-        assert context.is_dependency_monkey() is True
-        assert context.is_adviser() is False
-
-    def test_is_adviser(self) -> None:
-        """Test checking if the given context is an adviser context."""
-        context = Context(
+    @pytest.mark.parametrize(
+        "recommendation_type,decision_type,expect",
+        [
+            (None, _ALL, "dm"),
+            (_LATEST, None, "adv"),
+            # Decision type and recommendation type cannot be set to None at the same time.
+            (None, None, ValueError),
+            # Decision type and recommendation type cannot be set at the same time.
+            (_LATEST, _ALL, ValueError),
+        ],
+    )
+    def test_context_type_matrix(
+        self,
+        recommendation_type: Optional[RecommendationType],
+        decision_type: Optional[DecisionType],
+        expect: Union[str, Type[Exception]],
+    ) -> None:
+        """Exactly one type (recommendation/decision) has to be provided on instantiation."""
+        kwargs = dict(
             project=None,
             graph=None,
             library_usage=None,
             limit=None,
             count=None,
             beam=None,
-            recommendation_type=RecommendationType.LATEST,
-            decision_type=None,
+            recommendation_type=recommendation_type,
+            decision_type=decision_type,
         )
 
-        assert context.is_adviser() is True
-        assert context.is_dependency_monkey() is False
+        if expect is ValueError:
+            with pytest.raises(ValueError):
+                Context(**kwargs)
+            return
 
-    def test_invalid_context_no_type(self) -> None:
-        """Exactly one type (recommendation/decision) has to be provided on instantiation."""
-        with pytest.raises(ValueError):
-            Context(
-                project=None,
-                graph=None,
-                library_usage=None,
-                limit=None,
-                count=None,
-                beam=None,
-                # Decision type and recommendation type cannot be set to None at the same time.
-                recommendation_type=None,
-                decision_type=None,
-            )
-
-    def test_invalid_context_type(self) -> None:
-        """Context type cannot capture both adviser and dependency monkey type."""
-        with pytest.raises(ValueError):
-            Context(
-                project=None,
-                graph=None,
-                library_usage=None,
-                limit=None,
-                count=None,
-                beam=None,
-                # Decision type and recommendation type cannot be set at the same time.
-                recommendation_type=RecommendationType.LATEST,
-                decision_type=DecisionType.ALL,
-            )
+        context = Context(**kwargs)
+        assert context.is_adviser() is (expect == "adv")
+        assert context.is_dependency_monkey() is (expect == "dm")
@@ -18,8 +18,14 @@
 """Test pipeline builder used for building pipeline configuration."""
 
 import os
+from contextlib import ExitStack
+from operator import attrgetter
+from typing import Callable
 from typing import Union
 from typing import Dict
+from typing import Generator
+from typing import List
+from unittest.mock import patch
 
 import flexmock
 import pytest
@@ -47,15 +53,36 @@ import tests.units as units
 from .base import AdviserTestCase
 from .helpers import use_test_units
 
-
-@pytest.fixture
-def builder_context() -> PipelineBuilderContext:
-    """Fixture for a builder context."""
+_LATEST = RecommendationType.LATEST
+_RANDOM = DecisionType.RANDOM
+_ALL = DecisionType.ALL
+
+
+# Private registries units are added to, keyed by package name or unit class name.
+_BUILDER_CONTEXT_REGISTRIES = (
+    "_boots",
+    "_pseudonyms",
+    "_sieves",
+    "_steps",
+    "_strides",
+    "_wraps",
+    "_boots_included",
+    "_pseudonyms_included",
+    "_sieves_included",
+    "_steps_included",
+    "_strides_included",
+    "_wraps_included",
+)
+
+
+@pytest.fixture(scope="class")
+def builder_context_shared() -> PipelineBuilderContext:
+    """Fixture for a builder context shared across tests of a class."""
     builder_context = PipelineBuilderContext(
         graph=None,
         project=None,
         library_usage=None,
-        decision_type=DecisionType.RANDOM,
+        decision_type=_RANDOM,
         recommendation_type=None,
     )
     builder_context.add_unit(units.boots.Boot1())
@@ -67,23 +94,50 @@ def builder_context() -> PipelineBuilderContext:
     return builder_context
 
 
+@pytest.fixture
+def builder_context(builder_context_shared: PipelineBuilderContext) -> Generator[PipelineBuilderContext, None, None]:
+    """Fixture for a builder context, units added by a test are rolled back on teardown."""
+    sizes = {
+        registry: {key: len(value) for key, value in getattr(builder_context_shared, registry).items()}
+        for registry in _BUILDER_CONTEXT_REGISTRIES
+    }
+
+    yield builder_context_shared
+
+    for registry in _BUILDER_CONTEXT_REGISTRIES:
+        registry_sizes = sizes[registry]
+        registered = getattr(builder_context_shared, registry)
+        for key in list(registered.keys()):
+            if key not in registry_sizes:
+                del registered[key]
+            else:
+                del registered[key][registry_sizes[key] :]
+
+
 class TestPipelineBuilderContext(AdviserTestCase):
     """Test context carried within pipeline builder."""
 
     def test_is_included(self, builder_context: PipelineBuilderContext) -> None:
         """Test check if the given pipeline unit is included."""
-        assert builder_context.is_included(units.boots.Boot1)
-        assert not builder_context.is_included(units.boots.Boot2)
-        assert builder_context.is_included(units.pseudonyms.Pseudonym1)
-        assert not builder_context.is_included(units.pseudonyms.Pseudonym2)
-        assert builder_context.is_included(units.sieves.Sieve1)
-        assert not builder_context.is_included(units.sieves.Sieve2)
-        assert builder_context.is_included(units.steps.Step1)
-        assert not builder_context.is_included(units.steps.Step2)
-        assert builder_context.is_included(units.strides.Stride1)
-        assert not builder_context.is_included(units.strides.Stride2)
-        assert builder_context.is_included(units.wraps.Wrap1)
-        assert not builder_context.is_included(units.wraps.Wrap2)
+        included_classes = {
+            units.boots.Boot1,
+            units.pseudonyms.Pseudonym1,
+            units.sieves.Sieve1,
+            units.steps.Step1,
+            units.strides.Stride1,
+            units.wraps.Wrap1,
+        }
+        excluded_classes = {
+            units.boots.Boot2,
+            units.pseudonyms.Pseudonym2,
+            units.sieves.Sieve2,
+            units.steps.Step2,
+            units.strides.Stride2,
+            units.wraps.Wrap2,
+        }
+        assert {
+            unit_class for unit_class in included_classes | excluded_classes if builder_context.is_included(unit_class)
+        } == included_classes
 
     def test_is_adviser_pipeline(self) -> None:
         """Test check for an adviser build context."""
@@ -92,7 +146,7 @@ class TestPipelineBuilderContext(AdviserTestCase):
             project=None,
             library_usage=None,
             decision_type=None,
-            recommendation_type=RecommendationType.LATEST,
+            recommendation_type=_LATEST,
         )
         assert builder_context.is_adviser_pipeline()
         assert not builder_context.is_dependency_monkey_pipeline()
@@ -103,7 +157,7 @@ class TestPipelineBuilderContext(AdviserTestCase):
             graph=None,
             project=None,
             library_usage=None,
-            decision_type=DecisionType.RANDOM,
+            decision_type=_RANDOM,
             recommendation_type=None,
         )
         assert builder_context.is_dependency_monkey_pipeline()
@@ -126,37 +180,38 @@ class TestPipelineBuilderContext(AdviserTestCase):
                 graph=None,
                 project=None,
                 library_usage=None,
-                decision_type=DecisionType.ALL,
-                recommendation_type=RecommendationType.LATEST,
+                decision_type=_ALL,
+                recommendation_type=_LATEST,
             )
 
     @pytest.mark.parametrize(
-        "unit_class,builder_context_attr",
+        "unit_class,accessor",
         [
-            (units.boots.Boot2, "boots"),
-            (units.pseudonyms.Pseudonym2, "pseudonyms"),
-            (units.sieves.Sieve2, "sieves"),
-            (units.steps.Step2, "steps"),
-            (units.strides.Stride2, "strides"),
-            (units.wraps.Wrap2, "wraps"),
+            (units.boots.Boot2, attrgetter("boots")),
+            (units.pseudonyms.Pseudonym2, attrgetter("pseudonyms")),
+            (units.sieves.Sieve2, attrgetter("sieves")),
+            (units.steps.Step2, attrgetter("steps")),
+            (units.strides.Stride2, attrgetter("strides")),
+            (units.wraps.Wrap2, attrgetter("wraps")),
         ],
+        ids=["boots", "pseudonyms", "sieves", "steps", "strides", "wraps"],
     )
     def test_add_unit(
         self,
         builder_context: PipelineBuilderContext,
         unit_class: Unit,
-        builder_context_attr: str,
+        accessor: Callable[[PipelineBuilderContext], List[Unit]],
     ) -> None:
         """Test addition of a unit."""
         assert not builder_context.is_included(unit_class)
         unit = unit_class()
         builder_context.add_unit(unit)
         assert builder_context.is_included(unit_class)
-        assert getattr(builder_context, builder_context_attr)[-1] is unit
+        assert accessor(builder_context)[-1] is unit
 
     def test_get_included_boots(self) -> None:
         """Test get included boots of the provided boot class."""
-        builder_context = PipelineBuilderContext(decision_type=DecisionType.RANDOM)
+        builder_context = PipelineBuilderContext(decision_type=_RANDOM)
         assert builder_context.get_included_boots(units.boots.Boot1) == []
         unit = units.boots.Boot1()
         builder_context.add_unit(unit)
@@ -164,7 +219,7 @@ class TestPipelineBuilderContext(AdviserTestCase):
 
     def test_get_included_pseudonyms(self) -> None:
         """Test get included pseudonyms of the provided pseudonym class."""
-        builder_context = PipelineBuilderContext(decision_type=DecisionType.RANDOM)
+        builder_context = PipelineBuilderContext(decision_type=_RANDOM)
         assert builder_context.get_included_pseudonyms(units.pseudonyms.Pseudonym1) == []
         unit = units.pseudonyms.Pseudonym1()
         builder_context.add_unit(unit)
@@ -172,7 +227,7 @@ class TestPipelineBuilderContext(AdviserTestCase):
 
     def test_get_included_sieves(self) -> None:
         """Get included sieves of the provided sieve class."""
-        builder_context = PipelineBuilderContext(decision_type=DecisionType.RANDOM)
+        builder_context = PipelineBuilderContext(decision_type=_RANDOM)
         assert builder_context.get_included_sieves(units.sieves.Sieve1) == []
         unit = units.sieves.Sieve1()
         builder_context.add_unit(unit)
@@ -180,7 +235,7 @@ class TestPipelineBuilderContext(AdviserTestCase):
 
     def test_get_included_steps(self) -> None:
         """Get included steps of the provided step class."""
-        builder_context = PipelineBuilderContext(decision_type=DecisionType.RANDOM)
+        builder_context = PipelineBuilderContext(decision_type=_RANDOM)
         assert builder_context.get_included_steps(units.steps.Step1) == []
         unit = units.steps.Step1()
         builder_context.add_unit(unit)
@@ -188,7 +243,7 @@ class TestPipelineBuilderContext(AdviserTestCase):
 
     def test_get_included_strides(self) -> None:
         """Get included strides of the provided stride class."""
-        builder_context = PipelineBuilderContext(decision_type=DecisionType.RANDOM)
+        builder_context = PipelineBuilderContext(decision_type=_RANDOM)
         assert builder_context.get_included_strides(units.strides.Stride1) == []
         unit = units.strides.Stride1()
         builder_context.add_unit(unit)
@@ -196,7 +251,7 @@ class TestPipelineBuilderContext(AdviserTestCase):
 
     def test_get_included_wraps(self) -> None:
         """Get included wraps of the provided wrap class."""
-        builder_context = PipelineBuilderContext(decision_type=DecisionType.RANDOM)
+        builder_context = PipelineBuilderContext(decision_type=_RANDOM)
         assert builder_context.get_included_wraps(units.wraps.Wrap1) == []
         unit = units.wraps.Wrap1()
         builder_context.add_unit(unit)
@@ -212,11 +267,11 @@ class TestPipelineBuilder(AdviserTestCase):
         [
             (
                 "get_adviser_pipeline_config",
-                {"recommendation_type": RecommendationType.LATEST},
+                {"recommendation_type": _LATEST},
             ),
             (
                 "get_dependency_monkey_pipeline_config",
-                {"decision_type": DecisionType.RANDOM},
+                {"decision_type": _RANDOM},
             ),
         ],
     )
@@ -228,33 +283,30 @@ class TestPipelineBuilder(AdviserTestCase):
         """Test building configuration."""
         # All test units do not register themselves - let's cherry-pick ones that should be present.
         # There are done 3 iterations in total during pipeline configuration creation.
-        flexmock(units.boots.Boot1).should_receive("should_include").and_return({"some_parameter": 1.0}).and_return(
-            None
-        ).and_return(None).times(3)
-        flexmock(units.pseudonyms.Pseudonym2).should_receive("should_include").and_return({}).and_return(
-            None
-        ).and_return(None).times(3)
-        flexmock(units.sieves.Sieve2).should_receive("should_include").and_return({"foo": "bar"}).and_return(
-            None
-        ).and_return(None).times(3)
-        flexmock(units.steps.Step1).should_receive("should_include").and_return({}).and_return(None).and_return(
-            None
-        ).times(3)
-        flexmock(units.strides.Stride2).should_receive("should_include").and_return({}).and_return(None).and_return(
-            None
-        ).times(3)
-        flexmock(units.strides.Stride1).should_receive("should_include").and_return(None).and_return(
-            {"linus": "torvalds"}
-        ).and_return(None).times(3)
-        flexmock(units.wraps.Wrap2).should_receive("should_include").and_return({}).and_return(None).and_return(
-            None
-        ).times(3)
-
-        # It is not relevant if adviser/dependency monkey is called in this case.
-        pipeline = getattr(PipelineBuilder, pipeline_config_method)(
-            graph=None, project=None, library_usage=None, **kwargs
-        )
+        should_include = [
+            (units.boots.Boot1, [{"some_parameter": 1.0}, None, None]),
+            (units.pseudonyms.Pseudonym2, [{}, None, None]),
+            (units.sieves.Sieve2, [{"foo": "bar"}, None, None]),
+            (units.steps.Step1, [{}, None, None]),
+            (units.strides.Stride2, [{}, None, None]),
+            (units.strides.Stride1, [None, {"linus": "torvalds"}, None]),
+            (units.wraps.Wrap2, [{}, None, None]),
+        ]
+
+        with ExitStack() as stack:
+            mocks = {
+                unit_class.__name__: stack.enter_context(
+                    patch.object(unit_class, "should_include", side_effect=side_effect)
+                )
+                for unit_class, side_effect in should_include
+            }
+
+            # It is not relevant if adviser/dependency monkey is called in this case.
+            pipeline = getattr(PipelineBuilder, pipeline_config_method)(
+                graph=None, project=None, library_usage=None, **kwargs
+            )
 
+        assert {name: mock.call_count for name, mock in mocks.items()} == dict.fromkeys(mocks, 3)
         assert pipeline.to_dict() == {
             "boots": [
                 {"name": "Boot1", "configuration": {"some_parameter": 1.0, "package_name": "flask"}, "unit_run": False}
@@ -299,7 +351,7 @@ class TestPipelineBuilder(AdviserTestCase):
         flexmock(units.steps.Step1).should_receive("should_include").and_return({}).and_return(None).times(2)
 
         pipeline = PipelineBuilder.get_adviser_pipeline_config(
-            recommendation_type=RecommendationType.LATEST,
+            recommendation_type=_LATEST,
             graph=None,
             project=project,
             library_usage=None,
@@ -320,7 +372,7 @@ class TestPipelineBuilder(AdviserTestCase):
             flexmock(units.steps.Step1).should_receive("should_include").times(0)
 
             pipeline = PipelineBuilder.get_adviser_pipeline_config(
-                recommendation_type=RecommendationType.LATEST,
+                recommendation_type=_LATEST,
                 graph=None,
                 project=None,
                 library_usage=None,